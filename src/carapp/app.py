@@ -1,211 +1,642 @@
 """Console-based CAR SCOUT application."""
 
+import csv
+import io
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 
 # Path to the CSV file used to persist car records between runs.
 DATA_FILE = "cars_data.csv"  # file with car data
 
+# Binary snapshot of the CSV data, loaded instead of parsing the CSV while it is up to date.
+SNAPSHOT_FILE = "cars_data.bin"
+
+# Latest allowed model year, read from the clock once at startup.
+CURRENT_YEAR = datetime.now().year
+
+# Shared string objects for the two valid transmission values.
+_TRANS = {"manual": sys.intern("manual"), "automatic": sys.intern("automatic")}
+
+# Snapshot layout: a magic header, the stamp (size, mtime in ns) of the CSV file it
+# mirrors and the number of cars, then per car a 2-byte length + UTF-8 bytes for brand
+# and model, followed by year (int16), km (uint32), transmission code and price (float64).
+_SNAPSHOT_MAGIC = b"CARSCOUT3"
+_STAMP = struct.Struct("<Qq")
+_COUNT = struct.Struct("<Q")
+_HEADER_SIZE = len(_SNAPSHOT_MAGIC) + _STAMP.size + _COUNT.size
+_STR_LEN = struct.Struct("<H")
+_CAR_TAIL = struct.Struct("<hIBd")
+_TRANS_CODES = {"manual": 0, "automatic": 1}
+_TRANS_NAMES = (_TRANS["manual"], _TRANS["automatic"])
+
+# Characters that force a CSV field to be quoted when saving.
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+# Files up to this size are read in one go; bigger ones are streamed row by row.
+BULK_READ_LIMIT = 100 * 1024 * 1024  # 100 MB
+
 
 # ---------- INPUT VALIDATION ----------
 
-def get_int(prompt: str, min_value: int | None = None, max_value: int | None = None) -> int:
+def get_int(
+    prompt: str,
+    min_value: int | None = None,
+    max_value: int | None = None,
+    _int=int,
+    _input=input,
+    _print=print,
+) -> int:
     """Ask user for an integer and (optionally) enforce a min/max range."""
+    # Builtins are bound as default arguments so the loop uses fast local lookups.
     while True:
-        text = input(prompt)
         try:
-            value = int(text)
-
-            if min_value is not None and value < min_value:
-                print(f"Please enter a number above {min_value}.")
-                continue
+            value = _int(_input(prompt))
+        except ValueError:
+            _print("Please enter a whole number (e.g. 2018).")
+            continue
 
-            if max_value is not None and value > max_value:
-                print(f"Please enter a number under {max_value}.")
-                continue
+        # Range checks stay outside the try block to keep the success path short.
+        if min_value is not None and value < min_value:
+            _print(f"Please enter a number above {min_value}.")
+            continue
 
-            return value
-        except ValueError:
-            print("Please enter a whole number (e.g. 2018).")
+        if max_value is not None and value > max_value:
+            _print(f"Please enter a number under {max_value}.")
+            continue
 
+        return value
 
 
-def get_float(prompt: str) -> float:
-    """Ask user for a float (number with decimals) and repeat until valid."""
+def get_float(
+    prompt: str,
+    finite: bool = False,
+    _float=float,
+    _isinf=math.isinf,
+    _input=input,
+    _print=print,
+) -> float:
+    """Ask user for a float (number with decimals) and (optionally) reject infinity."""
     # Loop forever until a valid float is returned.
     while True:
-        # Collect raw user input as text.
-        text = input(prompt)
         try:
             # Attempt to convert the input to a float; will raise on bad input.
-            value = float(text)  # try convert to float
-            # If conversion works, immediately return the numeric value.
-            return value
+            value = _float(_input(prompt))
         except ValueError:
             # If conversion fails, inform the user and repeat the loop.
-            print("Please enter a number (e.g. 12345.50).")
+            _print("Please enter a number (e.g. 12345.50).")
+            continue
 
+        # "nan" parses as a float but cannot be compared (value == value is False).
+        if value != value:
+            _print("Please enter a number (e.g. 12345.50).")
+            continue
 
-def get_non_empty_str(prompt: str) -> str:
+        if finite and _isinf(value):
+            _print("Please enter a finite number (e.g. 12345.50).")
+            continue
+
+        return value
+
+
+def get_non_empty_str(prompt: str, _input=input, _print=print) -> str:
     """Ask for non-empty text and repeat until something is entered."""
     while True:
-        text = input(prompt).strip()
-        if text != "":
+        text = _input(prompt).strip()
+        if text:
             return text
-        print("This field cannot be empty. Please enter something.")
+        _print("This field cannot be empty. Please enter something.")
 
 
 def get_transmission(prompt: str = "Transmission (manual/automatic): ") -> str:
     """Ask for transmission type and only accept 'manual' or 'automatic'."""
     while True:
         trans = input(prompt).strip().lower()
-        if trans in ("manual", "automatic"):
-            return trans
+        if trans in _TRANS:
+            # Return the shared interned string instead of a fresh copy.
+            return _TRANS[trans]
         print("Please type either 'manual' or 'automatic'.")
 
 
-# ---------- FILE FUNCTIONS ----------
+# ---------- DATA STORAGE ----------
 
-def load_cars() -> list[dict]:
+@dataclass(slots=True)
+class Car:
+    """One car record with fixed attribute slots instead of a per-instance dict."""
+
+    brand: str
+    model: str
+    year: int
+    km: int
+    trans: str
+    price: float
+
+
+@dataclass
+class CarDB:
     """
-    Read all cars from the file and return a list of dictionaries.
-    If the file does not exist, start with an empty list.
+    In-memory car storage as parallel lists (one list per field).
+    Car number i is made of brands[i], models[i], years[i], kms[i], trans[i] and prices[i].
+    Prices live in a contiguous float64 array; prices_sorted/sorted_ids keep them
+    in ascending order (with the matching car numbers) for binary-search lookups.
+    append() keeps the index current; after filling the columns directly, call reindex().
     """
-    # Prepare an empty list to hold car dictionaries.
-    cars: list[dict] = []
+
+    brands: list[str] = field(default_factory=list)
+    models: list[str] = field(default_factory=list)
+    years: list[int] = field(default_factory=list)
+    kms: list[int] = field(default_factory=list)
+    trans: list[str] = field(default_factory=list)
+    prices: array = field(default_factory=lambda: array("d"))
+    # Number of leading cars that are already stored in DATA_FILE.
+    saved: int = 0
+    # Stamp of DATA_FILE (see _csv_stamp) at the time those cars were stored there.
+    stamp: bytes | None = None
+    # Price index: all prices in ascending order and the car number of each.
+    prices_sorted: list[float] = field(default_factory=list)
+    sorted_ids: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Return the number of stored cars."""
+        return len(self.prices)
+
+    def append(self, car: Car) -> None:
+        """Store one car by appending each field to its own list."""
+        self.brands.append(car.brand)
+        self.models.append(car.model)
+        self.years.append(car.year)
+        self.kms.append(car.km)
+        self.trans.append(car.trans)
+        self.prices.append(car.price)
+        # NaN cannot be ordered, so such a car never enters the price index.
+        if car.price != car.price:
+            return
+        # Insert into the price index at its sorted position (after equal prices).
+        pos = bisect_right(self.prices_sorted, car.price)
+        self.prices_sorted.insert(pos, car.price)
+        self.sorted_ids.insert(pos, len(self.prices) - 1)
+
+    def truncate(self, size: int) -> None:
+        """Keep only the first `size` cars in every column (the price index is not touched)."""
+        del self.brands[size:]
+        del self.models[size:]
+        del self.years[size:]
+        del self.kms[size:]
+        del self.trans[size:]
+        del self.prices[size:]
+
+    def reindex(self) -> None:
+        """Rebuild the price index from scratch by sorting the price column (NaN left out)."""
+        prices = self.prices
+        # p == p is False only for NaN, which would break the sort order.
+        ids = [i for i, p in enumerate(prices) if p == p]
+        self.sorted_ids = sorted(ids, key=prices.__getitem__)
+        self.prices_sorted = [prices[i] for i in self.sorted_ids]
+
+
+# ---------- FILE FUNCTIONS ----------
+
+def _load_csv() -> CarDB:
+    """Parse all cars from the CSV file; raises FileNotFoundError if it is missing."""
+    # Pre-bind hot names as locals to skip global lookups in the parse loop.
+    int_ = int
+    float_ = float
+    intern = sys.intern
+    trans_get = _TRANS.get
+    # Check the size first so huge files are not pulled into memory at once.
+    size = os.path.getsize(DATA_FILE)
+    # Open with UTF-8 (accents) and a large buffer; newline="" lets csv handle line endings.
+    with open(DATA_FILE, "r", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        if size <= BULK_READ_LIMIT:
+            # Read the whole file in one call; StringIO(newline="") splits rows only
+            # on real line endings (str.splitlines would also split on \x85, \u2028, ...).
+            data = f.read()
+            lines = io.StringIO(data, newline="")
+            # One C pass gives the row count for "\n" and "\r\n" files.
+            n = data.count("\n") + 1
+        else:
+            # Very large file: stream it through the buffered handle instead,
+            # estimating the row count from the average line length of the first
+            # buffered block (peek does not move the read position).
+            lines = f
+            sample = f.buffer.peek(1 << 16)[: 1 << 16]
+            sample_lines = sample.count(b"\n")
+            # No "\n" in the sample: start small and let the columns double.
+            n = size * sample_lines // len(sample) + 1 if sample_lines else 1024
+
+        # Allocate every column once at the estimated size; the loop only regrows
+        # them if the estimate turns out too small.
+        db = CarDB(
+            [None] * n, [None] * n, [0] * n, [0] * n, [None] * n, array("d", bytes(8 * n))
+        )
+        brands = db.brands
+        models = db.models
+        years = db.years
+        kms = db.kms
+        trans = db.trans
+        prices = db.prices
+
+        # csv.reader parses each row in C and handles quoted fields with commas.
+        reader = csv.reader(lines)
+        i = 0
+        for row in reader:
+            # Short rows are blank or whitespace-only lines; skip them (full rows never pay for this).
+            if len(row) != 6 and not "".join(row).strip():
+                continue
+
+            # Estimate too small (e.g. "\r"-only line endings): double every column.
+            if i == n:
+                extra = n or 1024
+                brands.extend([None] * extra)
+                models.extend([None] * extra)
+                years.extend([0] * extra)
+                kms.extend([0] * extra)
+                trans.extend([None] * extra)
+                prices.frombytes(bytes(8 * extra))
+                n += extra
+
+            # Unpack the six expected fields of the row.
+            b, m, y, km, t, p = row
+
+            # Store each typed value in its slot of the column lists.
+            # Brands and transmissions repeat a lot, so share one string object each.
+            brands[i] = intern(b)
+            models[i] = m
+            years[i] = int_(y)
+            kms[i] = int_(km)
+            trans[i] = trans_get(t, t)
+            prices[i] = float_(p)
+            i += 1
+
+    # Drop the unused slots left over by blank lines and the size estimate.
+    db.truncate(i)
+    # Build the price index once, over the real prices only.
+    db.reindex()
+    return db
+
+
+def _csv_stamp() -> bytes | None:
+    """Return the packed size and mtime of the CSV file, or None if it does not exist."""
     try:
-        # Try opening the data file for reading using UTF-8 to handle accents.
-        f = open(DATA_FILE, "r", encoding="utf-8")
+        st = os.stat(DATA_FILE)
+    except FileNotFoundError:
+        return None
+    return _STAMP.pack(st.st_size, st.st_mtime_ns)
+
 
+def _snapshot_stamp() -> bytes | None:
+    """Return the CSV stamp recorded in the snapshot header, or None if there is no valid one."""
+    try:
+        with open(SNAPSHOT_FILE, "rb") as f:
+            header = f.read(_HEADER_SIZE)
     except FileNotFoundError:
+        return None
+    if len(header) != _HEADER_SIZE or not header.startswith(_SNAPSHOT_MAGIC):
+        return None
+    return header[len(_SNAPSHOT_MAGIC) : len(_SNAPSHOT_MAGIC) + _STAMP.size]
+
+
+def _load_snapshot() -> CarDB:
+    """Decode all cars from the binary snapshot, walking it through a read-only mmap."""
+    brands: list[str] = []
+    models: list[str] = []
+    years: list[int] = []
+    kms: list[int] = []
+    trans: list[str] = []
+    prices: list[float] = []
+    # Pre-bind hot names as locals to skip global lookups in the decode loop.
+    len_unpack = _STR_LEN.unpack_from
+    len_size = _STR_LEN.size
+    tail_unpack = _CAR_TAIL.unpack_from
+    tail_size = _CAR_TAIL.size
+    names = _TRANS_NAMES
+    intern = sys.intern
+
+    with open(SNAPSHOT_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[: len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC:
+            raise ValueError("not a car snapshot file")
+        (count,) = _COUNT.unpack_from(mm, len(_SNAPSHOT_MAGIC) + _STAMP.size)
+        offset = _HEADER_SIZE
+        end = len(mm)
+        while offset < end:
+            # Brand and model: length prefix, then the UTF-8 bytes.
+            (n,) = len_unpack(mm, offset)
+            offset += len_size
+            brands.append(intern(str(mm[offset : offset + n], "utf-8")))
+            offset += n
+            (n,) = len_unpack(mm, offset)
+            offset += len_size
+            models.append(str(mm[offset : offset + n], "utf-8"))
+            offset += n
+            # Fixed-size numeric tail of the record.
+            year, km, code, price = tail_unpack(mm, offset)
+            offset += tail_size
+            years.append(year)
+            kms.append(km)
+            trans.append(names[code])
+            prices.append(price)
+
+    # A crash can leave the header on disk without all records (or with extra ones).
+    if len(prices) != count:
+        raise ValueError("car snapshot is incomplete")
+
+    db = CarDB(brands, models, years, kms, trans, array("d", prices))
+    db.reindex()
+    return db
+
+
+def _save_snapshot(db: CarDB, start: int, stamp: bytes) -> None:
+    """
+    Write cars from index `start` on to the binary snapshot and record the CSV `stamp`.
+    start > 0 appends to a snapshot that holds exactly the first `start` cars;
+    start == 0 rewrites it. If a car cannot be stored in the format, the
+    snapshot is removed instead.
+    """
+    len_pack = _STR_LEN.pack
+    tail_pack = _CAR_TAIL.pack
+    codes = _TRANS_CODES
+    try:
+        with open(SNAPSHOT_FILE, "r+b" if start else "wb", buffering=1 << 20) as f:
+            write = f.write
+            # Blank the stamp and count while records are written, so a snapshot
+            # cut short by a crash never matches the CSV file.
+            write(_SNAPSHOT_MAGIC + bytes(_STAMP.size + _COUNT.size))
+            f.seek(0, os.SEEK_END)
+            for brand, model, year, km, trans, price in zip(
+                db.brands[start:],
+                db.models[start:],
+                db.years[start:],
+                db.kms[start:],
+                db.trans[start:],
+                db.prices[start:],
+            ):
+                brand_bytes = brand.encode("utf-8")
+                model_bytes = model.encode("utf-8")
+                write(
+                    len_pack(len(brand_bytes))
+                    + brand_bytes
+                    + len_pack(len(model_bytes))
+                    + model_bytes
+                    + tail_pack(year, km, codes[trans], price)
+                )
+            # Get every record onto disk before the header can claim they are there.
+            f.flush()
+            os.fsync(f.fileno())
+            # All records are in place: mark the snapshot as matching the CSV.
+            f.seek(len(_SNAPSHOT_MAGIC))
+            write(stamp + _COUNT.pack(len(db)))
+    except (OSError, KeyError, struct.error):
+        # Values the format cannot hold (or a write error): go on without a snapshot.
+        try:
+            os.remove(SNAPSHOT_FILE)
+        except OSError:
+            pass
+
+
+def load_cars() -> CarDB:
+    """
+    Read all cars and return them as a CarDB.
+    Uses the binary snapshot when its recorded CSV size and mtime match the
+    CSV file exactly, otherwise parses the CSV file and refreshes the snapshot.
+    If the CSV file does not exist, start with an empty database.
+    """
+    stamp = _csv_stamp()
+    if stamp is None:
         # If the file is missing, tell the user and start with no data.
         print("No data file found, starting with empty car list.")
-        return cars
-
-    # Iterate over every line in the opened file handle.
-    for line in f:
-        # Remove any trailing newline or surrounding whitespace.
-        line = line.strip()
-        # Skip completely empty lines to avoid parsing errors.
-        if line == "":
-            continue
+        return CarDB()
+
+    db = None
+    if _snapshot_stamp() == stamp:
+        try:
+            db = _load_snapshot()
+        except (OSError, ValueError, IndexError, struct.error):
+            # Damaged snapshot: ignore it and read the CSV file instead.
+            pass
+
+    if db is None:
+        try:
+            db = _load_csv()
+        except FileNotFoundError:
+            # The file vanished between the checks: start with no data.
+            print("No data file found, starting with empty car list.")
+            return CarDB()
+        # Store a fresh snapshot so the next start can skip CSV parsing.
+        _save_snapshot(db, 0, stamp)
+
+    # Every loaded car is stored in the CSV file as it is right now.
+    db.saved = len(db)
+    db.stamp = stamp
+    # Return the filled database to the caller.
+    return db
+
+
+def _ends_with_newline(path: str) -> bool:
+    """Return True if the file is empty or its last byte ends a line."""
+    with open(path, "rb") as f:
+        # Jump to the end instead of reading the whole file.
+        if f.seek(0, os.SEEK_END) == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) in (b"\n", b"\r")
+
+
+def _write_rows(f, brands, models, years, kms, trans, prices) -> None:
+    """Write cars, given as column sequences, to an open CSV file."""
+    # Text fields with commas, quotes or line breaks need proper CSV quoting.
+    if any(map(_NEEDS_QUOTING.search, chain(brands, models, trans))):
+        # Use "\n" line endings to match the existing data file.
+        writer = csv.writer(f, lineterminator="\n")
+        # Zip the column lists into rows with the six fields in a stable order.
+        writer.writerows(zip(brands, models, years, kms, trans, prices))
+    else:
+        # Plain data: join pre-built string tuples in C, one line per car.
+        rows = zip(brands, models, map(str, years), map(str, kms), trans, map(repr, prices))
+        f.writelines(",".join(row) + "\n" for row in rows)
+
+
+def save_cars(db: CarDB) -> None:
+    """
+    Save cars to the file.
+    Cars added since the last load/save are appended; the file is only
+    rewritten from scratch when it no longer matches what is in memory.
+    """
+    start = db.saved
+    total = len(db)
+    # Check before touching the CSV: appending is only safe while the CSV is
+    # unchanged since it last held the first `start` cars, and the snapshot
+    # only while it still mirrors that same CSV.
+    stamp = _csv_stamp()
+    csv_in_sync = stamp is not None and stamp == db.stamp
+    snapshot_in_sync = csv_in_sync and _snapshot_stamp() == stamp
+    if 0 < start <= total and csv_in_sync:
+        # The file already holds the first `start` cars: nothing new means nothing to do.
+        if start == total:
+            return
+        mode = "a"
+        # Make sure the first new row does not glue onto an unterminated last line.
+        prefix = "" if _ends_with_newline(DATA_FILE) else "\n"
+    else:
+        # Missing, empty or out-of-sync file: write every car again.
+        start = 0
+        mode = "w"
+        prefix = ""
+
+    # Open the CSV file with a large buffer so rows are flushed in big chunks.
+    with open(DATA_FILE, mode, encoding="utf-8", newline="", buffering=1 << 20) as f:
+        f.write(prefix)
+        _write_rows(
+            f,
+            db.brands[start:],
+            db.models[start:],
+            db.years[start:],
+            db.kms[start:],
+            db.trans[start:],
+            db.prices[start:],
+        )
+        # Push everything to disk once, at the end of the save.
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Keep the binary snapshot in step with the CSV file.
+    stamp = _csv_stamp()
+    _save_snapshot(db, start if snapshot_in_sync else 0, stamp)
 
-        # Split the CSV line into its six expected fields.
-        b, m, y, km, t, p = line.split(",")
-
-        # Build a dictionary for the current car with typed values.
-        car = {
-            "brand": b,
-            "model": m,
-            "year": int(y),
-            "km": int(km),
-            "trans": t,
-            "price": float(p),
-        }
-        # Append the structured car dictionary to the list.
-        cars.append(car)
-
-    # Close the file handle to free system resources.
-    f.close()
-
-    # Return the full list of car dictionaries to the caller.
-    return cars
-
-
-def save_cars(cars: list[dict]) -> None:
-    """Write all cars back into the file."""
-    # Open the CSV file for writing (overwrites existing content).
-    f = open(DATA_FILE, "w", encoding="utf-8")
-    # Loop over every car dictionary to serialize it.
-    for c in cars:
-        # Format a CSV line with the six fields in a stable order.
-        line = f"{c['brand']},{c['model']},{c['year']},{c['km']},{c['trans']},{c['price']}\n"
-        # Write the line to disk.
-        f.write(line)
-    # Close the file handle after all cars are written.
-    f.close()
+    # Everything in memory is now on disk.
+    db.saved = total
+    db.stamp = stamp
 
 
 # ---------- CORE FUNCTIONS ----------
 
-def show_all(cars: list[dict]) -> None:
+# Line template used by show_all for a single car.
+_CAR_LINE = "{} {} - {} - {} km - {} - CHF {}\n".format
+
+
+def show_all(db: CarDB) -> None:
     """Print all cars."""
     # Header to separate the section in the console.
     print("\n--- ALL CARS ---")
     
-    # Iterate through each stored car and print its details on one line.
-    for c in cars:
-        print(
-            c["brand"],
-            c["model"],
-            "-",
-            c["year"],
-            "-",
-            c["km"],
-            "km -",
-            c["trans"],
-            "- CHF",
-            c["price"],
-        )
+    # Fill one line template per car (map over the columns runs in C),
+    # then hand the whole listing to stdout in a single write.
+    sys.stdout.write(
+        "".join(map(_CAR_LINE, db.brands, db.models, db.years, db.kms, db.trans, db.prices))
+    )
 
 
-def search_cars(cars: list[dict]) -> None:
+def search_cars(db: CarDB) -> None:
     """Find cars under a max price (with validation)."""
     # Ask the user for the highest price they are willing to pay.
     max_price = get_float("Enter max price: ")
     # Intro text before listing matches.
     print("\nCars matching your budget:\n")
-    # Track whether any car meets the condition.
-    found = False
-
-    # Inspect each car and compare its price to the user's limit.
-    for c in cars:
-        if c["price"] <= max_price:
-            # If within budget, print a short summary and mark as found.
-            print(c["brand"], c["model"], "- CHF", c["price"])
-            found = True
+    # Binary-search the price index: every car before `cut` is within budget.
+    cut = bisect_right(db.prices_sorted, max_price)
 
     # If no car matched the condition, inform the user explicitly.
-    if not found:
+    if cut == 0:
         print("No cars found for your expected price.")
+        return
 
+    # Only the matching cars are touched, cheapest first. The price comes straight
+    # from the sorted index and the columns are bound locally, so each match costs
+    # two list lookups.
+    brands = db.brands
+    models = db.models
+    print_ = print
+    for i, price in zip(db.sorted_ids[:cut], db.prices_sorted[:cut]):
+        print_(brands[i], models[i], "- CHF", price)
 
-def add_car(cars: list[dict]) -> None:
-    """Add new car to the list (with validation)."""
+
+def read_car_row() -> Car | None:
+    """
+    Read one car as a single CSV line: brand,model,year,km,trans,price.
+    Used when input is piped in; returns None (with a message) for bad data.
+    """
+    # Parse the whole line in one go with the C csv parser.
+    row = next(csv.reader([input()]), [])
+    if len(row) != 6:
+        print("Please enter six comma-separated fields: brand,model,year,km,trans,price.")
+        return None
+
+    brand, model, year, km, trans, price = (value.strip() for value in row)
+    try:
+        year_value = int(year)
+        km_value = int(km)
+        price_value = float(price)
+    except ValueError:
+        print("Year and kilometers must be whole numbers, price must be a number.")
+        return None
+
+    # Apply the same rules as the interactive validators.
+    trans = trans.lower()
+    if (
+        brand == ""
+        or model == ""
+        or trans not in _TRANS
+        or not 1886 <= year_value <= CURRENT_YEAR
+        or km_value < 0
+        or not math.isfinite(price_value)
+    ):
+        print("Invalid car data, car not added.")
+        return None
+
+    return Car(sys.intern(brand), model, year_value, km_value, _TRANS[trans], price_value)
+
+
+def add_car(db: CarDB) -> None:
+    """Add new car to the database (with validation)."""
     # Section header for clarity in the console.
     print("\n--- ADD CAR ---")
-    # Gather textual fields directly.
-    brand = get_non_empty_str("Brand: ")
-    model = get_non_empty_str("Model: ")
-    # Collect numeric fields using validators to enforce correct types.
-    current_year = datetime.now().year
-    year = get_int("Year: ", min_value=1886, max_value=current_year)
-    km = get_int("Kilometers: ", min_value=0)
-    # Normalize transmission input by trimming spaces and lowering case.
-    trans = get_transmission()
-    # Gather price as a validated float.
-    price = get_float("Price: ")
-
-    # Construct a dictionary representing the new car.
-    new_car = {
-        "brand": brand,
-        "model": model,
-        "year": year,
-        "km": km,
-        "trans": trans,
-        "price": price,
-    }
-    # Store the new car in the in-memory list.
-    cars.append(new_car)
+
+    if not sys.stdin.isatty():
+        # Piped input (e.g. a script): take all six fields from one CSV line.
+        new_car = read_car_row()
+        if new_car is None:
+            return
+    else:
+        # Gather textual fields directly.
+        brand = get_non_empty_str("Brand: ")
+        model = get_non_empty_str("Model: ")
+        # Collect numeric fields using validators to enforce correct types.
+        year = get_int("Year: ", min_value=1886, max_value=CURRENT_YEAR)
+        km = get_int("Kilometers: ", min_value=0)
+        # Normalize transmission input by trimming spaces and lowering case.
+        trans = get_transmission()
+        # Gather price as a validated float.
+        price = get_float("Price: ", finite=True)
+        # Build the record, sharing the brand string.
+        new_car = Car(sys.intern(brand), model, year, km, trans, price)
+
+    # Store the new car in the in-memory database.
+    db.append(new_car)
     # Confirm to the user that the operation succeeded.
     print("Car added!")
 
 
+# Menu choices that map directly to an action on the car database.
+ACTIONS = {
+    "1": show_all,
+    "2": search_cars,
+    "3": add_car,
+}
+
+
 def main() -> None:
     """Main loop with menu."""
     # Greeting shown once when the program starts.
     print("Welcome to CAR SCOUT!\n")
     # Load existing cars from disk into memory.
-    cars = load_cars()
+    db = load_cars()
 
     # Run a perpetual menu loop until the user chooses to exit.
     while True:
@@ -219,16 +650,13 @@ def main() -> None:
         # Collect the user's menu selection.
         choice = input("Your choice: ")
 
-        # Dispatch to the correct function based on the choice.
-        if choice == "1":
-            show_all(cars)
-        elif choice == "2":
-            search_cars(cars)
-        elif choice == "3":
-            add_car(cars)
+        # Look up the matching action in the dispatch table.
+        action = ACTIONS.get(choice)
+        if action is not None:
+            action(db)
         elif choice == "4":
             # Persist all cars to disk before quitting.
-            save_cars(cars)
+            save_cars(db)
             # Say goodbye to give clear feedback.
             print("Saved. Goodbye!")
             # Break out of the loop to end the program.